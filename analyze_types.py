@@ -1,28 +1,49 @@
-import json
+import argparse
+from utils import json_loads
 
-count_with_type = 0
-count_without_type = 0
-total = 0
+def count_types(path: str = 'data/evals.jsonl', verbose: bool = False):
+    """Count eval rows with/without a `type` field (top-level or in `extra`)."""
+    count_with_type = 0
+    count_without_type = 0
+    total = 0
 
-with open('data/evals.jsonl', 'r', encoding='utf-8') as f:
-    for line in f:
-        line = line.strip()
-        if not line:
-            continue
-        total += 1
-        data = json.loads(line)
-        has_type_top = 'type' in data
-        has_type_extra = 'type' in (data.get('extra', {}) or {})
-        
-        if has_type_top or has_type_extra:
-            count_with_type += 1
-            if has_type_extra:
-                print(f'Entry {total}: extra.type = {data["extra"]["type"]}')
-        else:
-            count_without_type += 1
-            print(f'Entry {total}: NO TYPE FIELD')
+    # Read raw bytes: json_loads accepts them directly, so no str is decoded
+    # per line, and rows that never mention "type" can skip parsing entirely.
+    with open(path, 'rb') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            total += 1
+            if b'"type"' not in line:
+                count_without_type += 1
+                if verbose:
+                    print(f'Entry {total}: NO TYPE FIELD')
+                continue
+            data = json_loads(line)
+            has_type_top = 'type' in data
+            has_type_extra = 'type' in (data.get('extra', {}) or {})
 
-print(f'\nSummary:')
-print(f'Total entries: {total}')
-print(f'Entries with type field: {count_with_type}')
-print(f'Entries without type field: {count_without_type}')
+            if has_type_top or has_type_extra:
+                count_with_type += 1
+                if verbose and has_type_extra:
+                    print(f'Entry {total}: extra.type = {data["extra"]["type"]}')
+            else:
+                count_without_type += 1
+                if verbose:
+                    print(f'Entry {total}: NO TYPE FIELD')
+
+    return total, count_with_type, count_without_type
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Count eval log entries with a type field.')
+    parser.add_argument('path', nargs='?', default='data/evals.jsonl')
+    parser.add_argument('--verbose', action='store_true', help='print one line per entry')
+    args = parser.parse_args()
+
+    total, count_with_type, count_without_type = count_types(args.path, args.verbose)
+
+    print(f'\nSummary:')
+    print(f'Total entries: {total}')
+    print(f'Entries with type field: {count_with_type}')
+    print(f'Entries without type field: {count_without_type}')
@@ -1,15 +1,33 @@
 # api/main.py
+import os
+from typing import Dict
+
 from fastapi import FastAPI
 from api.models import KeywordResponse, Brief, WriterNotes
-from typing import Dict, Any
-from services import fetch_serp_snapshot  # already have
-from brief_renderer import brief_to_markdown
-from parsing import parse_brief_output
-from services import generate_writer_notes
+# services (OpenAI SDK, requests, prompt loading), brief_renderer and parsing
+# are imported by the endpoints that use them once they exist, so /health
+# and cold start don't pay for them.
 
 app = FastAPI(title="Keyword & Brief API")
 
+# Annotated return types double as response models: FastAPI then serializes
+# straight to JSON bytes through pydantic-core instead of jsonable_encoder
 @app.get("/health")
-def health(): return {"ok": True}
+def health() -> Dict[str, bool]: return {"ok": True}
 
 # You can fill implementations later; keep contracts stable.
+
+if __name__ == "__main__":
+    # python -m api.main
+    # loop/http "auto" use uvloop and httptools when installed
+    # (pip install "uvicorn[standard]"), else asyncio and h11.
+    import uvicorn
+    uvicorn.run(
+        "api.main:app",
+        host=os.getenv("API_HOST", "127.0.0.1"),
+        port=int(os.getenv("API_PORT", "8001")),
+        loop="auto",
+        http="auto",
+        workers=int(os.getenv("API_WORKERS", "1")),
+        log_level=os.getenv("API_LOG_LEVEL", "warning"),
+    )
@@ -1,11 +1,14 @@
 # api/models.py
 # Models for the AI Keyword Strategy Tool API
 
-# api/models.py
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 
 class KeywordRow(BaseModel):
+    # Accept the table's column names and the field names alike, so rows can be
+    # validated straight from df.to_dict("records") or from plain dicts
+    model_config = ConfigDict(populate_by_name=True)
+
     keyword: str = Field(..., alias="Keyword")
     intent: Optional[str] = Field(None, alias="Intent")
     qw_score: float = Field(..., alias="QW Score")
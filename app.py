@@ -7,31 +7,28 @@
 # ---------------------------------------------
 
 import os
+import re
 import json
 from datetime import datetime
 from typing import Optional, List
+import numpy as np
 import pandas as pd
 import streamlit as st
 from dotenv import load_dotenv
-from ui_helpers import render_copy_from_dataframe
 from services import KeywordService, generate_writer_notes, generate_brief_with_variant, fetch_serp_snapshot
-from parsing import SAFE_OUTPUT, parse_brief_output, detect_placeholders
-from utils import slugify, default_report_name
+from llm_client import get_openai_client
+from parsing import parse_brief_output
 from prompt_manager import prompt_manager
 from scoring import add_scores, quickwin_breakdown, explain_quickwin
 from eval_logger import log_eval
 from brief_renderer import brief_to_markdown_full
 from serp_utils import analyze_serp
-import json, time
 
 
 
-# OpenAI SDK (current usage style)
-# pip install --upgrade openai
 # -----------------------------
 # GLOBAL UI CONFIG & STATE INIT
 # -----------------------------
-from openai import OpenAI
 
 # --- GLOBAL UX: hero + state ---
 st.set_page_config(page_title="Keyword Quick Wins + AI Brief", page_icon="✨", layout="centered")
@@ -82,16 +79,18 @@ def _render_notes_section(title: str, items, why: str | None = None):
     for it in items:
         st.markdown(f"- {it}")
 
-import json, time
-from eval_logger import log_eval
-
 def _auto_log_brief(*, keyword: str, variant: str, prompt: str, brief_dict: dict,
                     usage: dict | None, latency_ms: float, serp_summary: dict | None,
-                    auto_flags: dict | None = None):
-    """Log every generated brief to evals.jsonl (no user action needed)."""
+                    auto_flags: dict | None = None, brief_json: str | None = None):
+    """
+    Log every generated brief to evals.jsonl (no user action needed).
+    Pass brief_json if the caller already serialized brief_dict.
+    """
     tokens_prompt  = (usage or {}).get("prompt_tokens")
     tokens_comp    = (usage or {}).get("completion_tokens")
-    output_chars   = len(json.dumps(brief_dict, ensure_ascii=False))
+    # Serialize once; reused for both the stored output and its length
+    output_json    = brief_json if brief_json is not None else json.dumps(brief_dict, ensure_ascii=False)
+    output_chars   = len(output_json)
     extra_payload = {
         "type": "content_brief",
         "app_version": "beta-mvp",
@@ -104,7 +103,7 @@ def _auto_log_brief(*, keyword: str, variant: str, prompt: str, brief_dict: dict
         variant=variant,
         keyword=keyword or "",
         prompt=prompt or "",
-        output=json.dumps(brief_dict, ensure_ascii=False),
+        output=output_json,
         latency_ms=latency_ms,
         tokens_prompt=tokens_prompt,
         tokens_completion=tokens_comp,
@@ -113,10 +112,17 @@ def _auto_log_brief(*, keyword: str, variant: str, prompt: str, brief_dict: dict
         extra=extra_payload,
     )
 
-def _brief_auto_flags(brief: dict) -> dict:
-    """Simple heuristics so we can analyze quality over time."""
+# Lower-cased once; matched against the lower-cased brief text
+_BRIEF_PLACEHOLDERS = ("chair name #", "product #", "section #", "tbd", "lorem")
+
+def _brief_auto_flags(brief: dict, brief_json: str | None = None) -> dict:
+    """
+    Simple heuristics so we can analyze quality over time.
+    Pass brief_json if the caller already serialized the brief.
+    """
     flags = {}
-    text = json.dumps(brief, ensure_ascii=False)
+    text = brief_json if brief_json is not None else json.dumps(brief, ensure_ascii=False)
+    text_lower = text.lower()
     flags["short_output"] = len(text) < 800
     flags["missing_title"] = not bool(brief.get("title"))
     meta = (brief.get("meta_description") or "").strip()
@@ -125,8 +131,7 @@ def _brief_auto_flags(brief: dict) -> dict:
     h2 = outline.get("H2") or outline.get("h2") or []
     flags["low_sections"] = (isinstance(h2, list) and len(h2) < 4)
     # placeholder sniff
-    placeholders = ["Chair Name #", "Product #", "Section #", "TBD", "Lorem"]
-    flags["has_placeholders"] = any(p.lower() in text.lower() for p in placeholders)
+    flags["has_placeholders"] = any(p in text_lower for p in _BRIEF_PLACEHOLDERS)
     return flags
 
 
@@ -135,75 +140,78 @@ def _brief_auto_flags(brief: dict) -> dict:
 # NAVIGATION & EVENT HANDLERS
 # -----------------------------
 
-def _current_step_help():
-    step = st.session_state.get("help_step", 1)
-    kw = st.session_state.get("selected_keyword") or st.session_state.get("seed_input") or "your topic"
-    if step == 1:
-        return {
-            "title": "Step 1 — Inputs",
-            "why": [
-# -----------------------------
-# SVG ICONS & HEADER UI
-# -----------------------------
-                "Clear inputs → better keyword discovery & intent match.",
-                "Country/language alignment avoids chasing irrelevant SERPs."
-            ],
-            "how": [
-                "Use a **broad seed** (e.g., 'ergonomic chair').",
-                "Fill **country/language** for localized SERPs.",
-                "Describe audience to bias toward buyer vs. info intent."
-            ],
-            "tips": [
-                "Avoid super‑niche seeds; you'll filter in Step 2.",
-                "Add 1–2 industry terms to improve related entities."
-            ],
-            "example": [
-                "Seed: `home office chairs`",
-                "Audience: `remote workers`  · Country: `US` · Language: `en`"
-            ]
-        }
-    elif step == 2:
-        return {
-            "title": "Step 2 — Quick‑Win Keywords",
-            "why": [
-                "Quick‑Win score highlights rankable opportunities.",
-                "Intent lets you prioritize buyer vs. info pages."
-            ],
-            "how": [
-                "Raise **Min score** to 60–80 to focus on winnable terms.",
-                "Use **Include/Exclude** to tighten topical focus.",
-                "Pick a keyword → we'll generate a brief automatically."
-            ],
-            "tips": [
-                "Prefer **specific** modifiers (size, price, 'near me').",
-                "Scan SERP for outdated/weak results to confirm opportunity."
-            ],
-            "example": [
-                "Selected: `affordable pool cleaning near me`",
-                "Reason: high intent + local modifier + decent volume."
-            ]
-        }
-    # step 3
-    return {
+# Help content per wizard step; built once, only step 3's example is per-keyword
+_STEP_HELP = {
+    1: {
+        "title": "Step 1 — Inputs",
+        "why": (
+            "Clear inputs → better keyword discovery & intent match.",
+            "Country/language alignment avoids chasing irrelevant SERPs."
+        ),
+        "how": (
+            "Use a **broad seed** (e.g., 'ergonomic chair').",
+            "Fill **country/language** for localized SERPs.",
+            "Describe audience to bias toward buyer vs. info intent."
+        ),
+        "tips": (
+            "Avoid super‑niche seeds; you'll filter in Step 2.",
+            "Add 1–2 industry terms to improve related entities."
+        ),
+        "example": (
+            "Seed: `home office chairs`",
+            "Audience: `remote workers`  · Country: `US` · Language: `en`"
+        ),
+    },
+    2: {
+        "title": "Step 2 — Quick‑Win Keywords",
+        "why": (
+            "Quick‑Win score highlights rankable opportunities.",
+            "Intent lets you prioritize buyer vs. info pages."
+        ),
+        "how": (
+            "Raise **Min score** to 60–80 to focus on winnable terms.",
+            "Use **Include/Exclude** to tighten topical focus.",
+            "Pick a keyword → we'll generate a brief automatically."
+        ),
+        "tips": (
+            "Prefer **specific** modifiers (size, price, 'near me').",
+            "Scan SERP for outdated/weak results to confirm opportunity."
+        ),
+        "example": (
+            "Selected: `affordable pool cleaning near me`",
+            "Reason: high intent + local modifier + decent volume."
+        ),
+    },
+    3: {
         "title": "Step 3 — AI Content Brief",
-        "why": [
+        "why": (
             "Structured briefs speed writing and improve on‑page SEO.",
             "Consistent H2/H3 + entities → better topical coverage."
-        ],
-        "how": [
+        ),
+        "how": (
             "Choose Variant **A** for stricter SEO; **B** for writer tone.",
             "Download Markdown and share with your writer/CMS.",
             "Rate the brief to improve prompts over time."
-        ],
-        "tips": [
+        ),
+        "tips": (
             "Add internal links to money pages.",
             "If SERP leaders are thin/outdated, expand sections and add FAQs."
-        ],
-        "example": [
-            f"Briefing: `{kw}`",
+        ),
+        "example": (
+            "Briefing: `{kw}`",
             "Includes: Title, Meta, Outline, Entities, Links, FAQs."
-        ]
-    }
+        ),
+    },
+}
+
+def _current_step_help():
+    step = st.session_state.get("help_step", 1)
+    if step in (1, 2):
+        return _STEP_HELP[step]
+    # step 3
+    kw = st.session_state.get("selected_keyword") or st.session_state.get("seed_input") or "your topic"
+    help3 = _STEP_HELP[3]
+    return {**help3, "example": (help3["example"][0].format(kw=kw),) + help3["example"][1:]}
 
 @st.dialog("Help & Guidance")  # modern Streamlit dialog
 def _help_dialog():
@@ -389,7 +397,8 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 client = None
 try:
     if OPENAI_API_KEY:
-        client = OpenAI(api_key=OPENAI_API_KEY)
+        # Shared per key, so Streamlit reruns don't rebuild the HTTP pool
+        client = get_openai_client(OPENAI_API_KEY)
 except Exception:
     client = None  # Tests will patch this.
 
@@ -482,11 +491,40 @@ def to_dataframe(data: dict) -> pd.DataFrame:
     Convert the model's JSON structure into a flat table:
     columns: keyword | category
     """
-    rows = []
+    # Build the two columns directly rather than one dict per keyword
+    keywords, categories = [], []
     for category in ("informational", "transactional", "branded"):
-        for kw in data.get(category, []) or []:
-            rows.append({"keyword": kw, "category": category})
-    return pd.DataFrame(rows) if rows else pd.DataFrame(columns=["keyword", "category"])
+        kws = data.get(category, []) or []
+        keywords.extend(kws)
+        categories.extend([category] * len(kws))
+    if not keywords:
+        return pd.DataFrame(columns=["keyword", "category"])
+    return pd.DataFrame({"keyword": keywords, "category": categories})
+
+def _split_terms(text: str) -> List[str]:
+    return [t.strip().lower() for t in text.split(",") if t.strip()]
+
+def _keyword_filter_mask(df: pd.DataFrame, min_score: float, include: str, exclude: str) -> pd.Series:
+    """
+    Step 2 filters: QW Score >= min_score, every include term present and
+    no exclude term present (case-insensitive substring match on Keyword).
+    """
+    filt = df["QW Score"] >= min_score
+    inc_terms, exc_terms = _split_terms(include), _split_terms(exclude)
+    if not (inc_terms or exc_terms) or not filt.any():
+        return filt
+    # Cheap numeric gate first: only rows that pass it get string work.
+    # Lower the column once, not once per term.
+    kw = df.loc[filt, "Keyword"].str.lower()
+    keep = pd.Series(True, index=kw.index)
+    for t in inc_terms:
+        # Plain substring test: user text is not a pattern
+        keep &= kw.str.contains(t, regex=False, na=False)
+    if exc_terms:
+        # Any exclude term rejects the row: one alternation, one scan
+        exc_re = re.compile("|".join(map(re.escape, exc_terms)))
+        keep &= ~kw.str.contains(exc_re, na=False)
+    return keep.reindex(df.index, fill_value=False)
 
 # ------------- STEP RENDERERS ------------------------
 
@@ -524,8 +562,8 @@ def render_step_1():
     available_prompts = list(prompt_options.keys())
     
     if available_prompts:
-        # Load display names from PromptManager
-        disp_map = prompt_manager.get_prompt_display_names()  # {key: "Pretty Label"}
+        # Display names from PromptManager: {key: "Pretty Label"}
+        disp_map = prompt_options
         inv_map = {v: k for k, v in disp_map.items()}  # reverse map
 
         available_prompts = list(disp_map.keys())
@@ -573,6 +611,9 @@ def render_step_1():
         st.session_state.ux_step = 2
         st.rerun()
 
+# Stand-in volumes until a real volume source is wired in; cycled over the rows
+_PLACEHOLDER_VOLUMES = np.array([1000, 800, 600, 400, 300])
+
 def render_step_2():
     st.subheader("🔎 Step 2 — Quick-Win Keywords")
     _step_tip_popover([
@@ -609,10 +650,10 @@ def render_step_2():
                     "opportunity": "QW Score"
                 })
                 # Add Volume column (placeholder for now)
-                df["Volume"] = pd.Series([1000, 800, 600, 400, 300] * (len(df) // 5 + 1))[:len(df)]
+                df["Volume"] = np.resize(_PLACEHOLDER_VOLUMES, len(df))
                 
                 if not df.empty:
-                    df = df.sort_values(["priority"], ascending=True).reset_index(drop=True)
+                    # add_scores returns rows in priority order (QW Score desc)
                     st.session_state.generated_df = df
                     st.success(f"Generated {len(df)} keywords!")
                     
@@ -647,13 +688,6 @@ def render_step_2():
                 st.rerun()
             return
 
-        # Normalize types
-        df = df.copy()
-        if "QW Score" in df.columns:
-            df["QW Score"] = pd.to_numeric(df["QW Score"], errors="coerce").fillna(0).clip(0,100)
-        if "Volume" in df.columns:
-            df["Volume"] = pd.to_numeric(df["Volume"], errors="coerce").fillna(0).astype(int)
-
         # Quick filters
         with st.expander("🔍 Filters", expanded=True):
             c1, c2, c3 = st.columns([1,1,1])
@@ -661,16 +695,7 @@ def render_step_2():
             include = c2.text_input("Include terms", value="", placeholder="comma-separated (optional)")
             exclude = c3.text_input("Exclude terms", value="", placeholder="comma-separated (optional)")
 
-        filt = (df["QW Score"] >= min_score)
-        if include.strip():
-            inc_terms = [t.strip().lower() for t in include.split(",") if t.strip()]
-            for t in inc_terms:
-                filt &= df["Keyword"].str.lower().str.contains(t, na=False)
-        if exclude.strip():
-            exc_terms = [t.strip().lower() for t in exclude.split(",") if t.strip()]
-            for t in exc_terms:
-                filt &= ~df["Keyword"].str.lower().str.contains(t, na=False)
-        fdf = df.loc[filt].reset_index(drop=True)
+        fdf = df.loc[_keyword_filter_mask(df, min_score, include, exclude)].reset_index(drop=True)
 
         if fdf.empty:
             st.warning("No rows after filters.")
@@ -681,7 +706,7 @@ def render_step_2():
 
         # Ensure there is a default pick (top by score, then volume)
         if not st.session_state.get("kw_pick_select") and not fdf.empty:
-            top_row = fdf.sort_values(["QW Score", "Volume"], ascending=False).iloc[0]
+            top_row = fdf.nlargest(1, ["QW Score", "Volume"]).iloc[0]
             st.session_state.kw_pick_select = top_row["Keyword"]
             st.session_state.selected_keyword = st.session_state.kw_pick_select  # keep in sync
         # ---- Enhanced Styler: color QW Score, volume bars, intent badges ----
@@ -725,12 +750,13 @@ def render_step_2():
         
         # Quick wins section
         top_n = 5
-        quick_wins = fdf.sort_values(["QW Score"], ascending=False).head(top_n)
+        # fdf keeps the stored priority order, so the top rows are the quick wins
+        quick_wins = fdf.head(top_n)
         
         with st.expander(f"⚡ Top {top_n} Quick Wins", expanded=True):
             st.caption(f"Highest scoring keywords for immediate content opportunities")
             
-            for idx, row in quick_wins.iterrows():
+            for idx, row in zip(quick_wins.index, quick_wins.to_dict("records")):
                 col1, col2, col3 = st.columns([3, 1, 1])
                 with col1:
                     intent_badge = render_intent_badge(row['Intent'])
@@ -864,6 +890,8 @@ def render_step_3():
                 st.session_state.brief_prompt = prompt_used
                 st.session_state.brief_latency = latency_ms
                 st.session_state.brief_usage = usage
+                st.session_state.brief_logged = False
+                st.session_state.brief_parsed = None
                 
             except Exception as e:
                 st.error(f"Error generating brief: {e}")
@@ -873,16 +901,23 @@ def render_step_3():
         
     if "brief_output" in st.session_state:
         output = st.session_state.brief_output
-        data, is_json = parse_brief_output(output)
+        # Parse once per generated brief; every widget interaction reruns this step
+        parsed = st.session_state.get("brief_parsed")
+        if parsed is None:
+            parsed = parse_brief_output(output)
+            st.session_state.brief_parsed = parsed
+        data, is_json = parsed
         
-        # Auto-log the brief immediately after successful parsing
-        if is_json:
+        # Auto-log the brief once, right after it is first parsed; later
+        # reruns of this step render the same brief and must not re-log it
+        if is_json and not st.session_state.get("brief_logged", False):
             # Measure latency if you can (surround your model call with time.time())
             latency_ms = float(st.session_state.get("brief_latency", 0) or 0)
             usage = st.session_state.get("brief_usage") or {}
 
-            # Flags + SERP
-            auto_flags = _brief_auto_flags(data)
+            # Flags + SERP; one serialization of the brief serves both
+            brief_json = json.dumps(data, ensure_ascii=False)
+            auto_flags = _brief_auto_flags(data, brief_json)
             serp_summary = (st.session_state.get("serp_data") or {}).get("summary")
 
             # Auto-log the brief
@@ -896,7 +931,9 @@ def render_step_3():
                     latency_ms=latency_ms,
                     serp_summary=serp_summary,
                     auto_flags=auto_flags,
+                    brief_json=brief_json,
                 )
+                st.session_state.brief_logged = True
                 # Optional: toast only in dev mode
                 if st.session_state.get("dev_mode"):
                     st.toast("Auto-logged brief ✔")
@@ -1111,7 +1148,7 @@ def render_step_3():
                         with st.spinner("Fetching SERP…"):
                             country = st.session_state.get("country", "US")
                             language = st.session_state.get("language", "en")
-                            serp_raw = fetch_serp_snapshot(keyword, country, language)
+                            serp_raw = fetch_serp_snapshot(keyword, country, language, use_cache=False)
                             serp = analyze_serp(serp_raw)
                             st.session_state["serp_data"] = serp
                         st.rerun()
@@ -1211,7 +1248,7 @@ def render_step_3():
     with col2:
         if st.button("🔄 Start Over"):
             # Reset session state
-            for key in ["ux_step", "selected_keyword", "generated_df", "brief_output", "brief_prompt", "brief_latency", "brief_usage"]:
+            for key in ["ux_step", "selected_keyword", "generated_df", "brief_output", "brief_prompt", "brief_latency", "brief_usage", "brief_logged", "brief_parsed"]:
                 if key in st.session_state:
                     del st.session_state[key]
             st.session_state.ux_step = 1
@@ -1,15 +1,18 @@
-import json
 import os
-from datetime import datetime
+
+from utils import json_dumps, json_loads
 
 # Backup the original file first
 backup_file = 'data/evals_backup.jsonl'
 original_file = 'data/evals.jsonl'
 
-print("Creating backup...")
+# Read the log once; the same text feeds the backup and the update pass
 with open(original_file, 'r', encoding='utf-8') as src:
-    with open(backup_file, 'w', encoding='utf-8') as dst:
-        dst.write(src.read())
+    original_text = src.read()
+
+print("Creating backup...")
+with open(backup_file, 'w', encoding='utf-8') as dst:
+    dst.write(original_text)
 
 print("Backup created as evals_backup.jsonl")
 
@@ -17,36 +20,40 @@ print("Backup created as evals_backup.jsonl")
 updated_entries = []
 total_updated = 0
 
-with open(original_file, 'r', encoding='utf-8') as f:
-    for line_num, line in enumerate(f, 1):
-        line = line.strip()
-        if not line:
-            continue
-            
-        data = json.loads(line)
-        
-        # Check if type field is missing
-        has_type_top = 'type' in data
-        has_type_extra = 'type' in (data.get('extra', {}) or {})
+# split on "\n" only: splitlines() also breaks on U+2028/U+2029/U+0085,
+# which JSON writers leave raw inside string values
+for line_num, line in enumerate(original_text.split("\n"), 1):
+    line = line.strip()
+    if not line:
+        continue
         
-        if not has_type_top and not has_type_extra:
-            # Add the missing type field
-            if 'extra' not in data:
-                data['extra'] = {}
-            elif data['extra'] is None:
-                data['extra'] = {}
-                
-            # Default to content_brief since most entries appear to be briefs
-            data['extra']['type'] = 'content_brief'
-            total_updated += 1
-            print(f"Updated entry {line_num}: Added type = content_brief")
-        
-        updated_entries.append(data)
+    data = json_loads(line)
+    
+    # Check if type field is missing
+    has_type_top = 'type' in data
+    has_type_extra = 'type' in (data.get('extra', {}) or {})
+    
+    if not has_type_top and not has_type_extra:
+        # Add the missing type field
+        if 'extra' not in data:
+            data['extra'] = {}
+        elif data['extra'] is None:
+            data['extra'] = {}
+            
+        # Default to content_brief since most entries appear to be briefs
+        data['extra']['type'] = 'content_brief'
+        total_updated += 1
+        print(f"Updated entry {line_num}: Added type = content_brief")
+    
+    updated_entries.append(data)
 
-# Write back the updated data
-with open(original_file, 'w', encoding='utf-8') as f:
-    for entry in updated_entries:
-        f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+# Write back the updated data in one go: build the new log in a temp file and
+# swap it in atomically, so an interrupted run never leaves a half-written log.
+if total_updated:
+    tmp_file = original_file + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(''.join(json_dumps(entry) + '\n' for entry in updated_entries))
+    os.replace(tmp_file, original_file)
 
 print(f"\nBackfill complete!")
 print(f"Total entries processed: {len(updated_entries)}")
@@ -7,7 +7,7 @@ Usage:
 """
 
 from __future__ import annotations
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional
 
 
 
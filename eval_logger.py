@@ -1,15 +1,31 @@
 # eval_logger.py
-import json, os, uuid, datetime
+import os, time, uuid
 from typing import Any, Dict, Optional
 
+from utils import json_dumps
+
 LOG_DIR = "data"
 LOG_PATH = os.path.join(LOG_DIR, "evals.jsonl")
 
 def _ensure_dir():
-    if not os.path.exists(LOG_DIR):
-        os.makedirs(LOG_DIR, exist_ok=True)
+    os.makedirs(LOG_DIR, exist_ok=True)
 
-def log_eval(
+def _time_ordered_id(ns: int) -> str:
+    """
+    UUIDv7-style id: a 48-bit millisecond timestamp followed by random bits,
+    so ids sort in creation order (uuid4 ids are fully random).
+    """
+    value = (ns // 1_000_000 & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+def _utc_iso(ns: int) -> str:
+    """UTC ISO-8601 timestamp with microseconds, e.g. 2025-08-20T05:57:11.468657Z."""
+    sec, rem = divmod(ns, 1_000_000_000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)) + f".{rem // 1000:06d}Z"
+
+def _build_row(
     *,
     variant: str,
     keyword: str,
@@ -21,14 +37,12 @@ def log_eval(
     user_rating: Optional[int] = None,   # 1–5
     user_notes: Optional[str] = None,
     extra: Optional[Dict[str, Any]] = None,
-):
-    """Append a single evaluation row to JSONL."""
-    _ensure_dir()
-    # Use timezone-aware UTC timestamp (avoid deprecated utcnow)
-    ts = datetime.datetime.now(datetime.UTC).isoformat().replace("+00:00", "Z")
-    row = {
-        "id": str(uuid.uuid4()),
-        "ts": ts,
+) -> Dict[str, Any]:
+    # One clock read feeds both the id and the ts
+    ns = time.time_ns()
+    return {
+        "id": _time_ordered_id(ns),
+        "ts": _utc_iso(ns),
         "variant": variant,
         "keyword": keyword,
         "prompt": prompt,
@@ -41,5 +55,35 @@ def log_eval(
         "output_chars": len(output) if output else 0,
         "extra": extra or {},
     }
+
+def _append_row(row: Dict[str, Any]) -> None:
+    _ensure_dir()
     with open(LOG_PATH, "a", encoding="utf-8") as f:
-        f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        f.write(json_dumps(row) + "\n")
+
+def log_eval(
+    *,
+    variant: str,
+    keyword: str,
+    prompt: str,
+    output: str,
+    latency_ms: float,
+    tokens_prompt: Optional[int] = None,
+    tokens_completion: Optional[int] = None,
+    user_rating: Optional[int] = None,   # 1–5
+    user_notes: Optional[str] = None,
+    extra: Optional[Dict[str, Any]] = None,
+):
+    """Append a single evaluation row to JSONL."""
+    _append_row(_build_row(
+        variant=variant,
+        keyword=keyword,
+        prompt=prompt,
+        output=output,
+        latency_ms=latency_ms,
+        tokens_prompt=tokens_prompt,
+        tokens_completion=tokens_completion,
+        user_rating=user_rating,
+        user_notes=user_notes,
+        extra=extra,
+    ))
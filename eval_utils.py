@@ -1,6 +1,7 @@
-import json, os
+import os
 import pandas as pd
 from typing import Optional
+from utils import json_loads
 
 LOG_DIR = "data"
 LOG_PATH = os.path.join(LOG_DIR, "evals.jsonl")
@@ -17,7 +18,7 @@ def load_evals_df(path: Optional[str] = None) -> pd.DataFrame:
         for line in f:
             if line.strip():
                 try:
-                    rows.append(json.loads(line))
+                    rows.append(json_loads(line))
                 except Exception:
                     pass
     df = pd.DataFrame(rows)
@@ -26,9 +27,14 @@ def load_evals_df(path: Optional[str] = None) -> pd.DataFrame:
         if col not in df.columns: df[col] = None
     # Flatten a couple of fields from extra if present
     if "extra" in df.columns:
-        df["auto_flags"] = df["extra"].apply(lambda x: (x or {}).get("auto_flags"))
-        df["is_json"] = df["extra"].apply(lambda x: (x or {}).get("is_json"))
-    # Sorting newest first
+        extras = [x if isinstance(x, dict) else {} for x in df["extra"].tolist()]
+        df["auto_flags"] = [x.get("auto_flags") for x in extras]
+        df["is_json"] = [x.get("is_json") for x in extras]
+    # Sorting newest first. The log is append-only, so rows are normally
+    # already in ts order and a reverse avoids the O(n log n) sort.
     if "ts" in df.columns:
-        df = df.sort_values("ts", ascending=False)
+        if df["ts"].is_monotonic_increasing:
+            df = df.iloc[::-1]
+        else:
+            df = df.sort_values("ts", ascending=False)
     return df
@@ -1,29 +1,79 @@
-from __future__ import annotations
-# Generic text generation for service wrappers
-def generate_text(prompt: str, json_mode: bool = False) -> str:
-    """
-    Generate text from LLM using the default client. Supports JSON mode.
-    """
-    client = KeywordLLMClient.create_default()
-    # Use generate_content_brief for generic prompt, or add a more flexible method if needed
-    if json_mode:
-        return client.generate_content_brief(prompt)
-    else:
-        return client.generate_keywords_raw(prompt, json_mode=False)
 # llm_client.py
 """
 OpenAI LLM client for keyword generation.
 Handles API communication, prompt building, and response processing.
 """
+from __future__ import annotations
+import functools
 import os
-from typing import Dict, Any, Optional
-from openai import OpenAI
+import threading
+from typing import Dict, Any, List, Optional
+from openai import OpenAI, OpenAIError, Timeout
 from dotenv import load_dotenv
 from prompt_manager import prompt_manager
 
+try:
+    import h2  # optional: lets the SDK's httpx transport speak HTTP/2
+except ImportError:
+    h2 = None
+
 # Load environment variables
 load_dotenv()
 
+# Process-wide default client, shared by every create_default() caller so the
+# underlying HTTP connection pool stays warm between requests/reruns.
+_default_client: Optional["KeywordLLMClient"] = None
+_default_client_lock = threading.Lock()
+
+# The SDK default waits up to 10 minutes for a response; a keyword or brief
+# call that takes longer than a minute is stuck, not slow.
+OPENAI_TIMEOUT = Timeout(60.0, connect=5.0)
+
+# Used when a prompt template is missing or fails to format; same
+# placeholders as the files in prompts/
+_FALLBACK_KEYWORD_PROMPT = """
+You are an expert SEO specialist. Generate 12 SEO keyword ideas for this business, grouped by search intent.
+
+BUSINESS DETAILS:
+- Description: {business_desc}
+- Industry: {industry}
+- Target audience: {audience}
+- Location/Market: {location}
+
+REQUIREMENTS:
+1. Generate exactly 12 keywords total
+2. Group by search intent: informational, transactional, branded
+3. Include a mix of short-tail and long-tail keywords
+4. Consider the target audience and location
+5. Return ONLY valid JSON in this exact format:
+
+{{
+  "informational": ["keyword1", "keyword2", "keyword3", "keyword4"],
+  "transactional": ["keyword5", "keyword6", "keyword7", "keyword8"],
+  "branded": ["keyword9", "keyword10", "keyword11", "keyword12"]
+}}
+
+Do not include any explanation, code blocks, or additional text.
+""".strip()
+
+_JSON_SYSTEM_MESSAGE = "You are an SEO expert. Return only valid JSON with no additional text."
+
+@functools.lru_cache(maxsize=4)
+def get_openai_client(api_key: str) -> OpenAI:
+    """
+    Return the OpenAI SDK client for `api_key`, built once and then reused.
+    Sharing it keeps the SDK's HTTP keep-alive pool warm across calls.
+    """
+    if h2 is not None:
+        # Concurrent calls multiplex over one connection instead of opening more
+        from openai import DefaultHttpxClient
+        return OpenAI(
+            api_key=api_key,
+            timeout=OPENAI_TIMEOUT,
+            http_client=DefaultHttpxClient(http2=True, timeout=OPENAI_TIMEOUT),
+        )
+    return OpenAI(api_key=api_key, timeout=OPENAI_TIMEOUT)
+
 class KeywordLLMClient:
     """OpenAI client specifically configured for keyword generation."""
     
@@ -54,7 +104,7 @@ class KeywordLLMClient:
         if not self.api_key.startswith("sk-"):
             raise ValueError("Invalid OpenAI API key format. Keys should start with 'sk-'")
         
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
     
     def build_keyword_prompt(
         self, 
@@ -88,30 +138,21 @@ class KeywordLLMClient:
             )
         except (ValueError, KeyError):
             # Fallback to default hardcoded prompt if template fails
-            return f"""
-You are an expert SEO specialist. Generate 12 SEO keyword ideas for this business, grouped by search intent.
-
-BUSINESS DETAILS:
-- Description: {business_desc}
-- Industry: {industry or "Not specified"}
-- Target audience: {audience or "General"}
-- Location/Market: {location or "Global"}
-
-REQUIREMENTS:
-1. Generate exactly 12 keywords total
-2. Group by search intent: informational, transactional, branded
-3. Include a mix of short-tail and long-tail keywords
-4. Consider the target audience and location
-5. Return ONLY valid JSON in this exact format:
-
-{{
-  "informational": ["keyword1", "keyword2", "keyword3", "keyword4"],
-  "transactional": ["keyword5", "keyword6", "keyword7", "keyword8"],
-  "branded": ["keyword9", "keyword10", "keyword11", "keyword12"]
-}}
-
-Do not include any explanation, code blocks, or additional text.
-""".strip()
+            return _FALLBACK_KEYWORD_PROMPT.format(
+                business_desc=business_desc,
+                industry=industry or "Not specified",
+                audience=audience or "General",
+                location=location or "Global",
+            )
+    
+    def _complete(self, messages: List[Dict[str, str]], **kwargs: Any) -> str:
+        """Single chat.completions call point; returns the message text."""
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            **kwargs
+        )
+        return response.choices[0].message.content or ""
     
     def generate_keywords_raw(self, prompt: str, json_mode: bool = False) -> str:
         """
@@ -132,27 +173,19 @@ Do not include any explanation, code blocks, or additional text.
             if json_mode:
                 kwargs["response_format"] = {"type": "json_object"}
             
-            response = self.client.chat.completions.create(
-                model=self.model,
+            return self._complete(
+                [
+                    {"role": "system", "content": _JSON_SYSTEM_MESSAGE},
+                    {"role": "user", "content": prompt},
+                ],
                 temperature=self.temperature,
                 max_tokens=self.max_tokens,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "You are an SEO expert. Return only valid JSON with no additional text."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    },
-                ],
                 **kwargs
             )
             
-            return response.choices[0].message.content or ""
-            
-        except Exception as e:
-            raise Exception(f"OpenAI API error: {str(e)}")
+        except OpenAIError as e:
+            # The SDK already retries connection errors, 429s and 5xx with backoff
+            raise Exception(f"OpenAI API error: {str(e)}") from e
     
     def generate_keywords(
         self, 
@@ -176,7 +209,9 @@ Do not include any explanation, code blocks, or additional text.
             Raw response text from the LLM
         """
         prompt = self.build_keyword_prompt(business_desc, industry, audience, location, prompt_template)
-        return self.generate_keywords_raw(prompt)
+        # Every keyword template asks for one JSON object; JSON mode guarantees
+        # a bare object, so parsing never has to strip fences or prose
+        return self.generate_keywords_raw(prompt, json_mode=True)
     
     def generate_content_brief(self, prompt: str) -> str:
         """
@@ -192,8 +227,18 @@ Do not include any explanation, code blocks, or additional text.
     
     @classmethod
     def create_default(cls) -> 'KeywordLLMClient':
-        """Create a client with default settings."""
-        return cls()
+        """
+        Return the shared client with default settings.
+
+        The instance is created on first use and reused afterwards; it is
+        rebuilt only if OPENAI_API_KEY changes.
+        """
+        global _default_client
+        api_key = os.getenv("OPENAI_API_KEY")
+        with _default_client_lock:
+            if _default_client is None or _default_client.api_key != api_key:
+                _default_client = cls()
+            return _default_client
     
     def test_connection(self) -> bool:
         """
@@ -204,14 +249,7 @@ Do not include any explanation, code blocks, or additional text.
         """
         try:
             # Simple test call
-            response = self.client.chat.completions.create(
-                model=self.model,
-                max_tokens=10,
-                messages=[
-                    {"role": "user", "content": "Hello"}
-                ],
-            )
-            return bool(response.choices[0].message.content)
+            return bool(self._complete([{"role": "user", "content": "Hello"}], max_tokens=10))
         except Exception:
             return False
 
@@ -224,6 +262,13 @@ def get_keywords_text(prompt: str, json_mode: bool = False) -> str:
     client = KeywordLLMClient.create_default()
     return client.generate_keywords_raw(prompt, json_mode=json_mode)
 
+# Generic text generation for service wrappers
+def generate_text(prompt: str, json_mode: bool = False) -> str:
+    """
+    Generate text from LLM using the default client. Supports JSON mode.
+    """
+    return get_keywords_text(prompt, json_mode=json_mode)
+
 def build_prompt(business_desc: str, industry: str, audience: str, location: str) -> str:
     """
     Legacy function for backward compatibility.
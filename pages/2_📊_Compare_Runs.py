@@ -1,16 +1,28 @@
 # pages/2_📊_Compare_Runs.py
 from __future__ import annotations
-import os, json
+import os
 from typing import List, Dict, Any
 import pandas as pd
 import streamlit as st
 
+from utils import json_loads
+
 st.set_page_config(page_title="Compare Runs", page_icon="📊", layout="wide")
 
 LOG_PATH = os.path.join("data", "evals.jsonl")
 
-@st.cache_data(show_spinner=False)
-def load_jsonl(path: str) -> pd.DataFrame:
+def _log_version(path: str) -> tuple:
+    """(mtime_ns, size) of the log; changes whenever a run is appended."""
+    try:
+        st_ = os.stat(path)
+    except OSError:
+        return (0, 0)
+    return (st_.st_mtime_ns, st_.st_size)
+
+# `version` is only part of the cache key: the parsed frame is reused across
+# reruns until the log file changes, then re-read once.
+@st.cache_data(show_spinner=False, max_entries=2)
+def load_jsonl(path: str, version: tuple = ()) -> pd.DataFrame:
     rows: List[Dict[str, Any]] = []
     if not os.path.exists(path):
         return pd.DataFrame()
@@ -20,7 +32,7 @@ def load_jsonl(path: str) -> pd.DataFrame:
             if not line:
                 continue
             try:
-                rows.append(json.loads(line))
+                rows.append(json_loads(line))
             except Exception:
                 # skip malformed lines but keep going
                 continue
@@ -57,16 +69,19 @@ def load_jsonl(path: str) -> pd.DataFrame:
         df["has_rating"] = df["user_rating"].notna()
     else:
         df["has_rating"] = False
-    # Sort newest first
+    # Sort newest first (append-only log: usually already ordered, so reverse)
     if "ts" in df.columns:
-        df = df.sort_values("ts", ascending=False)
+        if df["ts"].is_monotonic_increasing:
+            df = df.iloc[::-1]
+        else:
+            df = df.sort_values("ts", ascending=False)
     return df
 
 def main():
     st.title("📊 Compare Runs")
     st.caption("Browse and filter your brief generations and writer’s notes. Use this to compare A/B variants and quality over time.")
 
-    df = load_jsonl(LOG_PATH)
+    df = load_jsonl(LOG_PATH, _log_version(LOG_PATH))
     if df.empty:
         st.info("No logs yet. Generate a brief or writer’s notes, then save feedback.")
         return
@@ -160,19 +175,8 @@ def main():
         )
 
         if {"type","variant"}.issubset(fdf.columns):
-            chart_df = (
-                fdf.assign(
-                    user_rating=pd.to_numeric(fdf.get("user_rating", pd.Series(dtype=float)), errors="coerce"),
-                    output_chars=pd.to_numeric(fdf.get("output_chars", pd.Series(dtype=float)), errors="coerce"),
-                )
-                .groupby(["type","variant"], dropna=False)
-                .agg(
-                    avg_rating=("user_rating","mean"),
-                    avg_chars=("output_chars","mean"),
-                    runs=("variant","count"),
-                )
-                .reset_index()
-            )
+            # Reuse the single groupby above instead of aggregating fdf again
+            chart_df = perf[["type","variant","avg_rating","avg_chars","runs"]].copy()
 
             if metric_choice == "Average rating":
                 ycol = "avg_rating"
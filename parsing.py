@@ -8,14 +8,69 @@ from __future__ import annotations
 import json
 import re
 from typing import Dict, Any, List, Tuple
+from utils import json_loads
 
-# Safe fallback output structure
+# Safe fallback output structure (reference shape; never hand it out directly)
 SAFE_OUTPUT = {
     "informational": [],
     "transactional": [],
     "branded": []
 }
 
+def safe_output() -> Dict[str, List[str]]:
+    """
+    Fresh empty keyword structure.
+    Returns new lists on every call; SAFE_OUTPUT.copy() was shallow, so
+    _parse_simple_list_format's extend() wrote into the module-level lists.
+    """
+    return {"informational": [], "transactional": [], "branded": []}
+
+# Patterns are compiled once at import instead of being looked up in re's
+# internal cache on every parse call.
+_CODE_BLOCK_PATTERNS = (
+    re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL | re.IGNORECASE),  # ```json or ```
+    re.compile(r'`(\{.*?\})`', re.DOTALL | re.IGNORECASE),                      # Single backticks
+)
+
+_PROSE_JSON_PATTERNS = (
+    re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.DOTALL),  # Nested JSON
+    re.compile(r'\{[^}]+\}', re.DOTALL),                         # Simple JSON
+)
+
+# Category headers for simple list formats like "Informational: a, b"
+_LIST_FORMAT_PATTERNS = {
+    "informational": tuple(
+        re.compile(p, re.IGNORECASE | re.MULTILINE) for p in (
+            r"informational[:\s]+([^\n]+)",
+            r"information[:\s]+([^\n]+)",
+            r"info[:\s]+([^\n]+)",
+        )
+    ),
+    "transactional": tuple(
+        re.compile(p, re.IGNORECASE | re.MULTILINE) for p in (
+            r"transactional[:\s]+([^\n]+)",
+            r"transaction[:\s]+([^\n]+)",
+            r"commercial[:\s]+([^\n]+)",
+        )
+    ),
+    "branded": tuple(
+        re.compile(p, re.IGNORECASE | re.MULTILINE) for p in (
+            r"branded[:\s]+([^\n]+)",
+            r"brand[:\s]+([^\n]+)",
+        )
+    ),
+}
+
+_KEYWORD_SPLIT_RE = re.compile(r'[,;|•\n]')
+
+# Trailing comma before a closing brace/bracket, the most common way model
+# output that is otherwise valid JSON fails to parse
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+
+def _loads_repaired(text: str) -> Any:
+    """json_loads after dropping trailing commas; raises ValueError if still invalid."""
+    return json_loads(_TRAILING_COMMA_RE.sub(r'\1', text))
+
 def parse_keywords_from_model(raw_text: str) -> Dict[str, Any]:
     """
     Parse keywords from model response with robust fallback handling.
@@ -34,11 +89,11 @@ def parse_keywords_from_model(raw_text: str) -> Dict[str, Any]:
         Each containing a list of keyword strings
     """
     if not raw_text or not isinstance(raw_text, str):
-        return SAFE_OUTPUT.copy()
+        return safe_output()
     
     # Strategy 1: Direct JSON parsing
     try:
-        result = json.loads(raw_text.strip())
+        result = json_loads(raw_text)
         if _is_valid_keyword_structure(result):
             return result
     except json.JSONDecodeError:
@@ -60,7 +115,7 @@ def parse_keywords_from_model(raw_text: str) -> Dict[str, Any]:
         return result
     
     # Final fallback: return safe empty structure
-    return SAFE_OUTPUT.copy()
+    return safe_output()
 
 def _is_valid_keyword_structure(data: Any) -> bool:
     """Check if parsed data has the expected keyword structure."""
@@ -83,16 +138,10 @@ def _is_valid_keyword_structure(data: Any) -> bool:
 
 def _extract_from_code_blocks(text: str) -> Dict[str, Any] | None:
     """Extract JSON from markdown code blocks."""
-    patterns = [
-        r'```(?:json)?\s*(\{.*?\})\s*```',  # ```json or ```
-        r'`(\{.*?\})`',                      # Single backticks
-    ]
-    
-    for pattern in patterns:
-        matches = re.finditer(pattern, text, re.DOTALL | re.IGNORECASE)
-        for match in matches:
+    for pattern in _CODE_BLOCK_PATTERNS:
+        for match in pattern.finditer(text):
             try:
-                result = json.loads(match.group(1))
+                result = json_loads(match.group(1))
                 if _is_valid_keyword_structure(result):
                     return result
             except json.JSONDecodeError:
@@ -103,16 +152,10 @@ def _extract_from_code_blocks(text: str) -> Dict[str, Any] | None:
 def _extract_json_from_prose(text: str) -> Dict[str, Any] | None:
     """Extract JSON object from prose text."""
     # Look for JSON-like structures
-    patterns = [
-        r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}',  # Nested JSON
-        r'\{[^}]+\}',                         # Simple JSON
-    ]
-    
-    for pattern in patterns:
-        matches = re.finditer(pattern, text, re.DOTALL)
-        for match in matches:
+    for pattern in _PROSE_JSON_PATTERNS:
+        for match in pattern.finditer(text):
             try:
-                result = json.loads(match.group(0))
+                result = json_loads(match.group(0))
                 if _is_valid_keyword_structure(result):
                     return result
             except json.JSONDecodeError:
@@ -126,36 +169,17 @@ def _parse_simple_list_format(text: str) -> Dict[str, Any] | None:
     Informational: keyword1, keyword2
     Transactional: keyword3, keyword4
     """
-    result = SAFE_OUTPUT.copy()
+    result = safe_output()
     found_any = False
     
-    # Pattern to match category headers and keywords
-    patterns = {
-        "informational": [
-            r"informational[:\s]+([^\n]+)",
-            r"information[:\s]+([^\n]+)",
-            r"info[:\s]+([^\n]+)",
-        ],
-        "transactional": [
-            r"transactional[:\s]+([^\n]+)",
-            r"transaction[:\s]+([^\n]+)",
-            r"commercial[:\s]+([^\n]+)",
-        ],
-        "branded": [
-            r"branded[:\s]+([^\n]+)",
-            r"brand[:\s]+([^\n]+)",
-        ]
-    }
-    
-    for category, category_patterns in patterns.items():
+    for category, category_patterns in _LIST_FORMAT_PATTERNS.items():
         for pattern in category_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
+            for match in pattern.finditer(text):
                 keywords_text = match.group(1).strip()
                 # Split by common delimiters
                 keywords = [
                     kw.strip().strip('"\'`') 
-                    for kw in re.split(r'[,;|•\n]', keywords_text)
+                    for kw in _KEYWORD_SPLIT_RE.split(keywords_text)
                     if kw.strip()
                 ]
                 if keywords:
@@ -172,9 +196,11 @@ def clean_keywords(keywords_dict: Dict[str, Any]) -> Dict[str, List[str]]:
         keywords_dict: Raw keywords dictionary
         
     Returns:
-        Cleaned dictionary with guaranteed structure
+        Cleaned dictionary with guaranteed structure; each keyword appears
+        once (case-insensitive), in the first category that lists it
     """
-    result = SAFE_OUTPUT.copy()
+    result = safe_output()
+    seen = set()  # one accumulator across categories
     
     for category in ["informational", "transactional", "branded"]:
         if category in keywords_dict:
@@ -186,7 +212,10 @@ def clean_keywords(keywords_dict: Dict[str, Any]) -> Dict[str, List[str]]:
                     if isinstance(kw, str):
                         clean_kw = kw.strip().strip('"\'`')
                         if clean_kw and len(clean_kw) > 1:  # Skip very short keywords
-                            cleaned.append(clean_kw)
+                            key = clean_kw.lower()
+                            if key not in seen:
+                                seen.add(key)
+                                cleaned.append(clean_kw)
                 result[category] = cleaned
     
     return result
@@ -206,7 +235,7 @@ def validate_keywords_response(data: Any) -> Dict[str, List[str]]:
     elif isinstance(data, dict):
         parsed = data
     else:
-        parsed = SAFE_OUTPUT.copy()
+        parsed = safe_output()
     
     return clean_keywords(parsed)
 
@@ -226,7 +255,7 @@ def parse_brief_output(raw: str) -> Tuple[Dict[str, Any], bool]:
 
     # 1) Direct JSON
     try:
-        return json.loads(raw), True
+        return json_loads(raw), True
     except Exception:
         pass
 
@@ -237,7 +266,7 @@ def parse_brief_output(raw: str) -> Tuple[Dict[str, Any], bool]:
         if start != -1 and end != -1 and end > start:
             snippet = raw[start:end+1]
             try:
-                return json.loads(snippet), True
+                return json_loads(snippet), True
             except Exception:
                 pass
 
@@ -247,7 +276,12 @@ def parse_brief_output(raw: str) -> Tuple[Dict[str, Any], bool]:
     if start != -1 and end != -1 and end > start:
         snippet = raw[start:end+1]
         try:
-            return json.loads(snippet), True
+            return json_loads(snippet), True
+        except Exception:
+            pass
+        # 4) Near-valid JSON: repair trailing commas instead of dropping the output
+        try:
+            return _loads_repaired(snippet), True
         except Exception:
             pass
 
@@ -255,6 +289,13 @@ def parse_brief_output(raw: str) -> Tuple[Dict[str, Any], bool]:
     return {"raw": raw}, False
 
 
+_PLACEHOLDER_RE = re.compile("|".join(map(re.escape, (
+    "name #1", "name #2",
+    "product #1", "product #2",
+    "chair name #1", "model #1",
+    "example #1", "h3 1", "h2 1",
+))))
+
 def detect_placeholders(brief: Dict[str, Any]) -> bool:
     """
     Heuristic to flag generic placeholders in a brief
@@ -265,16 +306,9 @@ def detect_placeholders(brief: Dict[str, Any]) -> bool:
     except Exception:
         text = str(brief).lower()
 
-    patterns = [
-        "name #1", "name #2",
-        "product #1", "product #2",
-        "chair name #1", "model #1",
-        "example #1", "h3 1", "h2 1"
-    ]
-    return any(p in text for p in patterns)
+    return _PLACEHOLDER_RE.search(text) is not None
 
 # ---------- Generic JSON parser for tool outputs ----------
-from typing import Tuple
 
 def parse_json_object(raw: str) -> Tuple[Dict[str, Any], bool]:
     """
@@ -289,7 +323,7 @@ def parse_json_object(raw: str) -> Tuple[Dict[str, Any], bool]:
 
     # 1) direct
     try:
-        return json.loads(txt), True
+        return json_loads(txt), True
     except Exception:
         pass
 
@@ -299,7 +333,12 @@ def parse_json_object(raw: str) -> Tuple[Dict[str, Any], bool]:
     if start != -1 and end != -1 and end > start:
         snippet = txt[start:end+1]
         try:
-            return json.loads(snippet), True
+            return json_loads(snippet), True
+        except Exception:
+            pass
+        # 3) near-valid JSON with trailing commas
+        try:
+            return _loads_repaired(snippet), True
         except Exception:
             pass
 
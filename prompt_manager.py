@@ -1,6 +1,19 @@
 # prompt_manager.py
 import os
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+# Human-friendly labels for prompt templates, built once and shared read-only
+_PROMPT_DISPLAY_NAMES: Mapping[str, str] = MappingProxyType({
+    "default_seo": "🎯 Balanced SEO Strategy",
+    "competitive_analysis": "🔍 Competitive Analysis",
+    "long_tail_focus": "🌱 Long-Tail Keywords (Low Volume, High Intent)",
+    "trend_hunting": "📈 Trending Searches",
+    "local_seo": "📍 Local SEO Focus",
+    "buyer_intent": "💰 High Buyer Intent",
+    "content_gaps": "🔍 Content Gap Analysis",
+    "seasonal_trending": "🌟 Seasonal & Trending",
+})
 
 class PromptManager:
     """Manages different prompt templates for keyword generation and A/B variants."""
@@ -8,6 +21,8 @@ class PromptManager:
     def __init__(self, prompts_dir: str = "prompts"):
         self.prompts_dir = prompts_dir
         self._prompts_cache: Dict[str, str] = {}
+        # base name -> sorted variants, derived from the keys once per load
+        self._variants_by_base: Dict[str, List[str]] = {}
         self._load_prompts()
     
     def _load_prompts(self):
@@ -25,6 +40,16 @@ class PromptManager:
                         self._prompts_cache[prompt_name] = f.read().strip()
                 except Exception as e:
                     print(f"Warning: Could not load prompt {filename}: {e}")
+        self._index_variants()
+
+    def _index_variants(self):
+        """Group loaded prompt keys by base name so get_variants() is a lookup."""
+        index: Dict[str, List[str]] = {}
+        for key in self._prompts_cache:
+            base, variant = self._split_base_and_variant(key)
+            if variant:
+                index.setdefault(base, []).append(variant)
+        self._variants_by_base = {base: sorted(v) for base, v in index.items()}
     
     def get_available_prompts(self) -> List[str]:
         """Get list of available prompt names (raw keys, e.g., 'content_brief_A')."""
@@ -46,12 +71,7 @@ class PromptManager:
 
     def get_variants(self, base_name: str) -> List[str]:
         """List available variants for a base prompt (e.g., 'content_brief' -> ['A','B'])."""
-        variants = []
-        for key in self._prompts_cache.keys():
-            base, variant = self._split_base_and_variant(key)
-            if base == base_name and variant:
-                variants.append(variant)
-        return sorted(variants)
+        return list(self._variants_by_base.get(base_name, ()))
 
     def has_prompt_variant(self, base_name: str, variant: Optional[str]) -> bool:
         """Check if a base+variant exists."""
@@ -60,21 +80,13 @@ class PromptManager:
         return base_name in self._prompts_cache
     # -------------------------------------------------------------------
 
-    def get_prompt_display_names(self) -> Dict[str, str]:
+    def get_prompt_display_names(self) -> Mapping[str, str]:
         """
         Returns human-friendly labels for prompt templates.
         Maps internal keys to display names used in the UI.
+        The mapping is a shared read-only view; copy it before modifying.
         """
-        return {
-            "default_seo": "🎯 Balanced SEO Strategy",
-            "competitive_analysis": "🔍 Competitive Analysis",
-            "long_tail_focus": "🌱 Long-Tail Keywords (Low Volume, High Intent)",
-            "trend_hunting": "📈 Trending Searches",
-            "local_seo": "📍 Local SEO Focus",
-            "buyer_intent": "💰 High Buyer Intent",
-            "content_gaps": "🔍 Content Gap Analysis",
-            "seasonal_trending": "🌟 Seasonal & Trending",
-        }
+        return _PROMPT_DISPLAY_NAMES
 
     
     def get_prompt(self, prompt_name: str) -> str:
@@ -117,6 +129,7 @@ class PromptManager:
     def reload_prompts(self):
         """Reload all prompts from disk (useful for development)."""
         self._prompts_cache.clear()
+        self._variants_by_base = {}
         self._load_prompts()
 
 # Create a global instance
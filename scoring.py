@@ -1,7 +1,7 @@
 # ai_keyword_tool/scoring.py
 from __future__ import annotations
 import re
-from typing import Iterable
+import numpy as np
 import pandas as pd
 from typing import Dict, Any
 # Common commercial/action modifiers that signal purchase or strong intent
@@ -11,12 +11,22 @@ MODIFIERS = {
     "integrate","integration","tutorial","how to","setup","template","example"
 }
 
+# Big brand names that tend to dominate SERPs; compiled once, used per keyword
+BRAND_RE = re.compile(r"\b(?:amazon|google|microsoft|shopify|wordpress|ahrefs|semrush)\b", re.I)
+
 def is_long_tail(kw: str) -> bool:
     return len(kw.split()) >= 3
 
+# One alternation over all modifiers. The leading word boundary keeps "for" from
+# firing inside "platform" and "top" inside "laptop"; any word ending is allowed
+# so prefix variants ("buying", "cheapest", "compared", "bestseller") still count
+MODIFIER_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(m) for m in sorted(MODIFIERS, key=len, reverse=True)) + r")\w*",
+    re.I,
+)
+
 def has_modifier(kw: str) -> bool:
-    k = kw.lower()
-    return any(m in k for m in MODIFIERS)
+    return MODIFIER_RE.search(kw) is not None
 
 def guess_competition_score(kw: str) -> int:
     """
@@ -33,26 +43,26 @@ def guess_competition_score(kw: str) -> int:
     if has_modifier(kw):
         score -= 10
     # Brand-like tokens often increase competition unless it’s the user’s brand (unknown here)
-    if re.search(r"\b(amazon|google|microsoft|shopify|wordpress|ahrefs|semrush)\b", kw, re.I):
+    if BRAND_RE.search(kw):
         score += 10
     # Clamp
     return max(0, min(100, score))
 
+# Opportunity adjustment per intent; anything else is neutral
+_INTENT_BOOST = {
+    "transactional": 10, "commercial": 10,
+    "informational": 5,
+    "branded": -10,
+    "navigational": -5,
+}
+
 def opportunity_from_row(keyword: str, intent: str) -> int:
     """
     Compute a 0–100 opportunity score using simple, transparent rules:
     Base 50, then adjust with intent, long-tail, modifiers, and heuristic competition.
     """
-    base = 50
     # Intent weighting
-    if intent in ("transactional", "commercial"):
-        base += 10
-    elif intent in ("informational",):
-        base += 5
-    elif intent in ("branded",):
-        base -= 10
-    elif intent in ("navigational",):
-        base -= 5
+    base = 50 + _INTENT_BOOST.get(intent, 0)
 
     # Shape signals
     if is_long_tail(keyword):
@@ -67,22 +77,37 @@ def opportunity_from_row(keyword: str, intent: str) -> int:
     # Clamp
     return int(max(0, min(100, base)))
 
+def opportunity_scores(keywords: pd.Series, intents: pd.Series) -> np.ndarray:
+    """
+    Column-wise opportunity_from_row() for a whole keyword table.
+    Same rules and results, computed with one regex pass per signal.
+    """
+    kw = keywords.astype(str)
+    long_tail = (kw.str.split().str.len() >= 3).to_numpy()
+    modifier = kw.str.contains(MODIFIER_RE, na=False).to_numpy()
+    brand = kw.str.contains(BRAND_RE, na=False).to_numpy()
+
+    comp = 50 + np.where(long_tail, -10, 20) - 10 * modifier + 10 * brand
+    comp = np.clip(comp, 0, 100)
+
+    intent = intents.astype(str).str.lower().map(_INTENT_BOOST).fillna(0).to_numpy()
+    opp = 50 + intent + 10 * long_tail + 10 * modifier + np.trunc((50 - comp) * 0.4)
+    return np.clip(opp, 0, 100).astype(int)
+
 def add_scores(df: pd.DataFrame, intent_col: str = "category", kw_col: str = "keyword") -> pd.DataFrame:
     """
-    Returns a new DataFrame with `opportunity` (0–100) and `priority` (1 = highest).
+    Returns a new DataFrame with `opportunity` (0–100) and `priority` (1 = highest),
+    rows in priority order (opportunity desc, then keyword) with a fresh index.
     `category` is treated as intent; rename if your column differs.
     """
     if df.empty or kw_col not in df.columns or intent_col not in df.columns:
         return df.assign(opportunity=[], priority=[])
     scored = df.copy()
-    scored["opportunity"] = [
-        opportunity_from_row(k, str(i).lower()) for k, i in zip(scored[kw_col], scored[intent_col])
-    ]
+    scored["opportunity"] = opportunity_scores(scored[kw_col], scored[intent_col])
     # Highest opportunity gets priority 1
+    # Sorted once here; callers can rely on row order instead of re-sorting
     scored = scored.sort_values(by=["opportunity", kw_col], ascending=[False, True]).reset_index(drop=True)
     scored["priority"] = range(1, len(scored) + 1)
-    # Restore original order for display, but keep the new cols
-    scored = scored.reindex(sorted(scored.index), copy=False)
     return scored
 
 # Breakdown Helper
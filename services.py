@@ -1,8 +1,50 @@
-import json
-from typing import Dict, Any, Optional, Tuple
+# services.py
+"""
+High-level service functions for keyword generation.
+Coordinates between LLM client and parsing logic.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import llm_client
+from llm_client import KeywordLLMClient, generate_text
+from parsing import parse_json_object, parse_keywords_from_model, validate_keywords_response, safe_output
 from prompt_manager import prompt_manager
-from llm_client import generate_text  # adjust if named differently
-from parsing import parse_json_object
+from utils import json_dumps
+
+def _normalize_llm_result(result: Any) -> Tuple[str, Optional[Dict[str, int]]]:
+    """
+    Split an LLM client result into (text, usage).
+    Clients return either plain text or a dict like {"text": ..., "usage": {...}}.
+    """
+    if isinstance(result, dict):
+        text = result.get("text") or result.get("output") or ""
+        return text, result.get("usage")  # e.g., {"prompt_tokens":..., "completion_tokens":...}
+    return str(result), None
+
+def _prune_empty(obj: Any) -> Any:
+    """
+    Drop None, empty strings and empty containers (recursively) so prompt
+    payloads carry no tokens the model can't use. 0 and False are kept.
+    """
+    if isinstance(obj, dict):
+        pruned = {k: _prune_empty(v) for k, v in obj.items()}
+        return {k: v for k, v in pruned.items() if v not in (None, "", [], {})}
+    if isinstance(obj, (list, tuple)):
+        pruned = [_prune_empty(v) for v in obj]
+        return [v for v in pruned if v not in (None, "", [], {})]
+    if isinstance(obj, str):
+        return obj.strip()
+    return obj
+
 # Service wrapper for Writer's Notes
 def generate_writer_notes(
     *,
@@ -19,38 +61,16 @@ def generate_writer_notes(
         base_name="writer_notes",
         variant=variant,
         keyword=keyword,
-        brief_json=json.dumps(brief_dict, ensure_ascii=False),
-        serp_summary_json=json.dumps(serp_summary or {}, ensure_ascii=False),
+        brief_json=json_dumps(_prune_empty(brief_dict)),
+        serp_summary_json=json_dumps(_prune_empty(serp_summary or {})),
     )
 
     # Prefer JSON mode for strict JSON output if your client supports it
     result = generate_text(prompt, json_mode=True)  # set json_mode in llm_client if available
-    # Normalize
-    if isinstance(result, dict):
-        raw_text = result.get("text") or result.get("output") or ""
-        usage = result.get("usage")
-    else:
-        raw_text, usage = str(result), None
+    raw_text, usage = _normalize_llm_result(result)
 
     notes, ok = parse_json_object(raw_text)
     return notes, ok, prompt, usage
-# services.py
-"""
-High-level service functions for keyword generation.
-Coordinates between LLM client and parsing logic.
-"""
-
-import json
-from typing import Dict, Any, Optional, Tuple
-from prompt_manager import prompt_manager
-from llm_client import generate_text  # adjust if named differently
-from parsing import parse_json_object
-import time
-from typing import Dict, Any, Tuple, Optional
-from llm_client import KeywordLLMClient
-from parsing import parse_keywords_from_model, validate_keywords_response, SAFE_OUTPUT
-import llm_client
-from prompt_manager import prompt_manager
 
 class KeywordService:
     """Service class for keyword generation operations."""
@@ -96,7 +116,7 @@ class KeywordService:
             
         except Exception as e:
             print(f"Warning: Error in keyword generation: {e}")
-            return SAFE_OUTPUT.copy()
+            return safe_output()
     
     def generate_content_brief(
         self,
@@ -169,7 +189,7 @@ def get_keywords_safe(prompt: str) -> Dict[str, Any]:
         return validate_keywords_response(parsed)
     except Exception as e:
         print(f"Warning: Error in get_keywords_safe: {e}")
-        return SAFE_OUTPUT.copy()
+        return safe_output()
 
 # Convenience function for quick usage
 def generate_keywords_simple(business_desc: str) -> Dict[str, Any]:
@@ -215,38 +235,99 @@ def generate_brief_with_variant(
     
     latency_ms = (time.monotonic() - t0) * 1000
 
-    # Normalize output + usage
     # For now, the client returns a string, so we don't have usage data
     # This can be enhanced later when the LLM client returns usage information
-    if isinstance(result, dict):
-        output = result.get("text") or result.get("output") or ""
-        usage = result.get("usage")  # e.g., {"prompt_tokens":..., "completion_tokens":...}
-    else:
-        output, usage = str(result), None
+    output, usage = _normalize_llm_result(result)
 
     return output, prompt, latency_ms, usage
 
 
 # ------------- SERP Snapshot Utilities ------------------------
 
-import os
-import requests
-from typing import List, Dict, Any
+# Exact-match cache for provider results. Step 3 re-runs on every Streamlit
+# interaction, so without it the same keyword re-pays the SERP API round trip.
+SERP_CACHE_SIZE = 256
+SERP_CACHE_TTL_S = 3600
+_serp_cache: "OrderedDict[Tuple[str, str, str, str], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+_serp_cache_lock = threading.Lock()
+
+def _serp_cache_get(key: Tuple[str, str, str, str]) -> Optional[List[Dict[str, Any]]]:
+    with _serp_cache_lock:
+        hit = _serp_cache.get(key)
+        if hit is None:
+            return None
+        stored_at, results = hit
+        if time.monotonic() - stored_at > SERP_CACHE_TTL_S:
+            del _serp_cache[key]
+            return None
+        _serp_cache.move_to_end(key)
+        return [dict(r) for r in results]
+
+def _serp_cache_put(key: Tuple[str, str, str, str], results: List[Dict[str, Any]]) -> None:
+    with _serp_cache_lock:
+        _serp_cache[key] = (time.monotonic(), [dict(r) for r in results])
+        _serp_cache.move_to_end(key)
+        while len(_serp_cache) > SERP_CACHE_SIZE:
+            _serp_cache.popitem(last=False)
 
-def fetch_serp_snapshot(keyword: str, country: str = "US", language: str = "en") -> List[Dict[str, Any]]:
+def clear_serp_cache() -> None:
+    """Drop every cached SERP snapshot."""
+    with _serp_cache_lock:
+        _serp_cache.clear()
+
+# One pooled session for SERP providers: repeat lookups reuse the open
+# TLS connection, and transient 429/5xx answers are retried with backoff.
+# Both providers' search calls are read-only, so POST is safe to retry.
+# Connect/read failures are not retried: a down or hung provider should hit
+# the mock fallback after one timeout, not three.
+_SERP_SESSION = requests.Session()
+_SERP_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=2,
+        connect=0,
+        read=0,
+        other=0,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+    ),
+))
+
+def fetch_serp_snapshot(
+    keyword: str,
+    country: str = "US",
+    language: str = "en",
+    *,
+    use_cache: bool = True,
+) -> List[Dict[str, Any]]:
     """
     Return top results with keys: title, url, snippet.
     Supports providers via env:
       SERP_PROVIDER = "serper" | "serpapi" | "mock" (default)
       SERP_API_KEY  = "<key>"
+    Provider results are cached per (provider, keyword, country, language)
+    for SERP_CACHE_TTL_S seconds; pass use_cache=False to force a refetch.
     """
     provider = os.getenv("SERP_PROVIDER", "mock").lower()
     api_key  = os.getenv("SERP_API_KEY", "")
 
+    # Case and spacing variants of a keyword share one entry
+    query = " ".join(keyword.lower().split())
+    if not query:
+        # Nothing to search for: skip the paid round trip, use the mock rows below
+        provider = "mock"
+    cache_key = (provider, query, country, language)
+    if use_cache and provider in ("serper", "serpapi") and api_key:
+        cached = _serp_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
     try:
         if provider == "serper" and api_key:
             # https://serper.dev/ (simple, cheap)
-            resp = requests.post(
+            resp = _SERP_SESSION.post(
                 "https://google.serper.dev/search",
                 headers={"X-API-KEY": api_key, "Content-Type": "application/json"},
                 json={"q": keyword, "gl": country, "hl": language, "num": 5},
@@ -255,13 +336,15 @@ def fetch_serp_snapshot(keyword: str, country: str = "US", language: str = "en")
             resp.raise_for_status()
             js = resp.json()
             items = js.get("organic", [])[:5]
-            return [{"title": it.get("title"),
-                     "url":   it.get("link"),
-                     "snippet": it.get("snippet")} for it in items]
+            results = [{"title": it.get("title"),
+                        "url":   it.get("link"),
+                        "snippet": it.get("snippet")} for it in items]
+            _serp_cache_put(cache_key, results)
+            return results
 
         if provider == "serpapi" and api_key:
             # https://serpapi.com/
-            resp = requests.get(
+            resp = _SERP_SESSION.get(
                 "https://serpapi.com/search.json",
                 params={"q": keyword, "hl": language, "gl": country, "num": 5, "api_key": api_key},
                 timeout=12
@@ -269,12 +352,14 @@ def fetch_serp_snapshot(keyword: str, country: str = "US", language: str = "en")
             resp.raise_for_status()
             js = resp.json()
             items = js.get("organic_results", [])[:5]
-            return [{"title": it.get("title"),
-                     "url":   it.get("link"),
-                     "snippet": it.get("snippet") or it.get("description")} for it in items]
+            results = [{"title": it.get("title"),
+                        "url":   it.get("link"),
+                        "snippet": it.get("snippet") or it.get("description")} for it in items]
+            _serp_cache_put(cache_key, results)
+            return results
 
-    except Exception:
-        # fall through to mock on any error
+    except (requests.RequestException, ValueError):
+        # fall through to mock on network/HTTP errors or a non-JSON body
         pass
 
     # Mock fallback (works offline / no key)
@@ -0,0 +1,15 @@
+# tests/unit/test_api_models.py
+from api.models import KeywordRow
+
+
+def test_keyword_row_accepts_column_and_field_names():
+    by_alias = KeywordRow.model_validate({"Keyword": "crm", "QW Score": 70, "Intent": "transactional"})
+    by_name = KeywordRow(keyword="crm", qw_score=70, intent="transactional")
+    assert by_alias == by_name
+
+
+def test_contract_schemas_are_built_at_import():
+    # No forward refs or defer_build: validators exist before the first request
+    from api.models import KeywordResponse, Brief, WriterNotes
+    for model in (KeywordRow, KeywordResponse, Brief, WriterNotes):
+        assert model.__pydantic_complete__, model.__name__
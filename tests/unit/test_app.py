@@ -257,6 +257,70 @@ class TestFileOperations:
         assert filename.endswith(".csv")
 
 
+class TestBriefAutoFlags:
+    """Test the quality heuristics logged with each brief."""
+
+    def test_placeholders_detected_case_insensitively(self):
+        from app import _brief_auto_flags
+        flags = _brief_auto_flags({"title": "Best chairs", "outline": {"H2": ["Chair NAME #1"]}})
+        assert flags["has_placeholders"] is True
+        assert flags["low_sections"] is True
+
+    def test_clean_brief_has_no_placeholders(self):
+        from app import _brief_auto_flags
+        flags = _brief_auto_flags({"title": "Best chairs", "meta_description": "x" * 50})
+        assert flags["has_placeholders"] is False
+        assert flags["missing_title"] is False
+
+    def test_auto_log_reuses_serialized_brief(self, monkeypatch):
+        import app
+        logged = {}
+        monkeypatch.setattr(app, "log_eval", lambda **kw: logged.update(kw))
+        brief = {"title": "Best chairs"}
+        brief_json = json.dumps(brief)
+        flags = app._brief_auto_flags(brief, brief_json)
+        app._auto_log_brief(keyword="chairs", variant="A", prompt="p", brief_dict=brief, usage=None,
+                            latency_ms=1.0, serp_summary=None, auto_flags=flags, brief_json=brief_json)
+        assert logged["output"] is brief_json
+        assert logged["extra"]["output_chars"] == len(brief_json)
+
+
+class TestKeywordFilterMask:
+    """Step 2 include/exclude filters."""
+
+    def _df(self):
+        return pd.DataFrame({
+            "Keyword": ["Best CRM software", "crm pricing", "free crm", "CRM (open source)"],
+            "QW Score": [80, 70, 40, 90],
+        })
+
+    def test_include_all_terms_exclude_any(self):
+        from app import _keyword_filter_mask
+        df = self._df()
+        mask = _keyword_filter_mask(df, 50, "crm", "pricing, (open")
+        assert df.loc[mask, "Keyword"].tolist() == ["Best CRM software"]
+
+    def test_no_terms_is_score_only(self):
+        from app import _keyword_filter_mask
+        df = self._df()
+        mask = _keyword_filter_mask(df, 60, " ", "")
+        assert mask.tolist() == [True, True, False, True]
+
+    def test_string_filters_skip_rows_below_score(self):
+        from app import _keyword_filter_mask
+        df = self._df()
+        df.loc[2, "Keyword"] = None  # below the score gate; never inspected
+        mask = _keyword_filter_mask(df, 50, "crm", "")
+        assert mask.tolist() == [True, True, False, True]
+        assert mask.dtype == bool
+
+    def test_include_terms_are_literal(self):
+        from app import _keyword_filter_mask
+        df = self._df()
+        mask = _keyword_filter_mask(df, 0, "(open", "")
+        assert df.loc[mask, "Keyword"].tolist() == ["CRM (open source)"]
+
+
 # Test configuration
 if __name__ == "__main__":
     # Run tests with pytest
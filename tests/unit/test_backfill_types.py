@@ -0,0 +1,23 @@
+# tests/unit/test_backfill_types.py
+import json
+import os
+import runpy
+
+SCRIPT = os.path.join(os.path.dirname(__file__), "..", "..", "backfill_types.py")
+
+
+def test_backfill_keeps_rows_with_unicode_line_separators(monkeypatch, tmp_path):
+    os.makedirs(tmp_path / "data")
+    rows = [
+        {"id": "1", "output": "first\u2028second", "extra": {}},
+        {"id": "2", "output": "ok", "extra": {"type": "writer_notes"}},
+    ]
+    log = tmp_path / "data" / "evals.jsonl"
+    log.write_text("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows), encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    runpy.run_path(SCRIPT)
+
+    out = [json.loads(l) for l in log.read_text(encoding="utf-8").split("\n") if l]
+    assert [r["output"] for r in out] == ["first\u2028second", "ok"]
+    assert [r["extra"]["type"] for r in out] == ["content_brief", "writer_notes"]
@@ -0,0 +1,16 @@
+# tests/unit/test_eval_utils.py
+import json
+from eval_utils import load_evals_df
+
+def test_load_evals_df_flattens_extra(tmp_path):
+    path = tmp_path / "evals.jsonl"
+    rows = [
+        {"id": "1", "ts": "2025-01-01T00:00:00Z", "extra": {"is_json": True, "auto_flags": {"short_output": False}}},
+        {"id": "2", "ts": "2025-01-02T00:00:00Z", "extra": None},
+    ]
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows) + "not json\n", encoding="utf-8")
+
+    df = load_evals_df(str(path))
+    assert df["id"].tolist() == ["2", "1"]  # newest first
+    assert df["is_json"].tolist() == [None, True]
+    assert df["auto_flags"].tolist() == [None, {"short_output": False}]
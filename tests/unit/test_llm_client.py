@@ -0,0 +1,70 @@
+# tests/unit/test_llm_client.py
+from llm_client import KeywordLLMClient
+
+
+def test_create_default_reuses_client(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-one")
+    first = KeywordLLMClient.create_default()
+    assert KeywordLLMClient.create_default() is first
+
+
+def test_create_default_rebuilds_when_key_changes(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-one")
+    first = KeywordLLMClient.create_default()
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-two")
+    second = KeywordLLMClient.create_default()
+    assert second is not first
+    assert second.api_key == "sk-test-two"
+
+
+def test_clients_share_sdk_instance_per_key():
+    a = KeywordLLMClient(api_key="sk-test-shared")
+    b = KeywordLLMClient(api_key="sk-test-shared", model="gpt-4o")
+    assert a.client is b.client
+
+
+def test_sdk_client_uses_bounded_timeout():
+    from llm_client import OPENAI_TIMEOUT, get_openai_client
+    assert get_openai_client("sk-test-timeout").timeout == OPENAI_TIMEOUT
+
+
+def test_build_keyword_prompt_falls_back_when_template_missing():
+    client = KeywordLLMClient(api_key="sk-test-fallback")
+    prompt = client.build_keyword_prompt("bakery {cakes}", prompt_template="no_such_template")
+    assert "- Description: bakery {cakes}" in prompt
+    assert "- Industry: Not specified" in prompt
+    assert '"informational": [' in prompt
+
+
+def test_requests_share_one_completion_helper(monkeypatch):
+    from types import SimpleNamespace
+    calls = []
+
+    def fake_create(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content='{"a": 1}'))])
+
+    client = KeywordLLMClient(api_key="sk-test-request", model="gpt-4o-mini")
+    monkeypatch.setattr(client, "client", SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=fake_create))))
+
+    messages = [{"role": "user", "content": "prompt"}]
+    assert client._complete(messages, response_format={"type": "json_object"}) == '{"a": 1}'
+    assert client.test_connection() is True
+    first, second = calls
+    assert first["model"] == "gpt-4o-mini" and first["messages"] == messages
+    assert first["response_format"] == {"type": "json_object"}
+    assert second["max_tokens"] == 10 and "response_format" not in second
+
+
+def test_generate_keywords_requests_json_mode(monkeypatch):
+    client = KeywordLLMClient(api_key="sk-test-json-mode")
+    seen = {}
+
+    def fake_raw(prompt, json_mode=False):
+        seen["json_mode"] = json_mode
+        return "{}"
+
+    monkeypatch.setattr(client, "generate_keywords_raw", fake_raw)
+    client.generate_keywords("bakery")
+    assert seen["json_mode"] is True
@@ -0,0 +1,37 @@
+# tests/unit/test_parsing.py
+from parsing import parse_brief_output, parse_json_object
+
+def test_brief_with_trailing_commas_is_repaired():
+    raw = '```json\n{"title": "Best chairs", "faqs": ["a", "b",],}\n```'
+    data, is_json = parse_brief_output(raw)
+    assert is_json
+    assert data == {"title": "Best chairs", "faqs": ["a", "b"]}
+
+def test_json_object_with_trailing_comma_is_repaired():
+    data, is_json = parse_json_object('Notes: {"tone": "friendly",}')
+    assert is_json and data == {"tone": "friendly"}
+
+def test_unrepairable_output_stays_raw():
+    data, is_json = parse_json_object("{not json at all}")
+    assert not is_json and data == {"raw": "{not json at all}"}
+
+def test_detect_placeholders():
+    from parsing import detect_placeholders
+    assert detect_placeholders({"outline": ["Chair Name #1 review"]})
+    assert not detect_placeholders({"outline": ["Herman Miller Aeron review"]})
+
+def test_list_format_does_not_leak_into_fallback():
+    from parsing import SAFE_OUTPUT, parse_keywords_from_model
+    first = parse_keywords_from_model("Informational: seo tips, seo guide")
+    assert first["informational"] == ["seo tips", "seo guide"]
+    assert parse_keywords_from_model("nothing useful") == {"informational": [], "transactional": [], "branded": []}
+    assert SAFE_OUTPUT["informational"] == []
+
+def test_clean_keywords_drops_duplicates_across_categories():
+    from parsing import clean_keywords
+    out = clean_keywords({
+        "informational": ["CRM guide", "crm guide", "crm pricing"],
+        "transactional": ["Crm Pricing", "buy crm"],
+        "branded": ["buy crm"],
+    })
+    assert out == {"informational": ["CRM guide", "crm pricing"], "transactional": ["buy crm"], "branded": []}
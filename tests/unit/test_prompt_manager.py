@@ -0,0 +1,21 @@
+# tests/unit/test_prompt_manager.py
+from prompt_manager import PromptManager
+
+def _write(dirpath, name, text="Keyword: {keyword}"):
+    (dirpath / f"{name}.txt").write_text(text, encoding="utf-8")
+
+def test_get_variants_sorted_per_base(tmp_path):
+    for name in ("content_brief_B", "content_brief_A", "writer_notes_A", "competitive_analysis"):
+        _write(tmp_path, name)
+    pm = PromptManager(prompts_dir=str(tmp_path))
+    assert pm.get_variants("content_brief") == ["A", "B"]
+    assert pm.get_variants("writer_notes") == ["A"]
+    assert pm.get_variants("missing") == []
+
+def test_reload_picks_up_new_variants(tmp_path):
+    _write(tmp_path, "content_brief_A")
+    pm = PromptManager(prompts_dir=str(tmp_path))
+    pm.get_variants("content_brief").append("Z")  # callers get a copy
+    _write(tmp_path, "content_brief_C")
+    pm.reload_prompts()
+    assert pm.get_variants("content_brief") == ["A", "C"]
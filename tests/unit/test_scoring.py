@@ -7,6 +7,15 @@ def test_long_tail_and_modifiers():
     assert has_modifier("pricing for crm software")
     assert not has_modifier("email marketing")
 
+def test_modifiers_match_whole_words():
+    assert has_modifier("Marketing Tools")
+    assert has_modifier("crm near me")
+    assert has_modifier("buying a crm")
+    assert has_modifier("cheapest crm")
+    assert has_modifier("discounted crm plans")
+    assert has_modifier("compared crms") and has_modifier("bestseller chairs")
+    assert not has_modifier("laptop platform")
+
 def test_competition_bounds():
     for kw in ["crm", "crm pricing", "best crm software for startups"]:
         c = guess_competition_score(kw)
@@ -27,3 +36,14 @@ def test_add_scores_produces_columns_and_priority_order():
     # Priority 1 should be the highest opportunity
     top = out.sort_values("priority").iloc[0]
     assert top["opportunity"] == out["opportunity"].max()
+    # Rows come back already in priority order
+    assert out["priority"].tolist() == [1, 2, 3]
+    assert out["opportunity"].is_monotonic_decreasing
+
+def test_batch_scores_match_row_scores():
+    from scoring import opportunity_scores
+    keywords = ["crm", "crm pricing", "best crm software for startups", "shopify themes",
+                "how to set up google analytics", "laptop platform", "amazon seller tools near me"]
+    intents = ["Informational", "transactional", "commercial", "branded", "informational", "navigational", "other"]
+    batch = opportunity_scores(pd.Series(keywords), pd.Series(intents))
+    assert list(batch) == [opportunity_from_row(k, i.lower()) for k, i in zip(keywords, intents)]
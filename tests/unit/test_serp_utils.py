@@ -0,0 +1,22 @@
+# tests/unit/test_serp_utils.py
+from serp_utils import analyze_serp
+
+def test_analyze_serp_keeps_top_five():
+    results = [{"title": f"Result {i}", "url": f"https://site{i}.com", "snippet": "x" * 100} for i in range(8)]
+    out = analyze_serp(results)
+    assert [r["title"] for r in out["rows"]] == [f"Result {i}" for i in range(5)]
+    assert out["summary"]["total"] == 5
+
+def test_analyze_serp_handles_empty():
+    assert analyze_serp(None)["summary"] == {"total": 0, "weak_any": 0, "weak_forum": 0, "weak_thin": 0, "weak_old": 0}
+
+def test_weak_signals():
+    rows = analyze_serp([
+        {"title": "Chairs", "url": "https://www.reddit.com/r/chairs", "snippet": "x" * 100},
+        {"title": "What is an ergonomic chair", "url": "https://a.com", "snippet": "y" * 100},
+        {"title": "Chair community picks", "url": "https://b.com", "snippet": "Updated 2019. " + "z" * 100},
+        {"title": "Ergonomic chairs tested", "url": "https://c.com", "snippet": "w" * 100},
+    ])["rows"]
+    assert [r["weak_forum"] for r in rows] == [True, False, True, False]
+    assert [r["weak_thin"] for r in rows] == [False, True, False, False]
+    assert rows[2]["weak_old"] and not rows[3]["weak_any"]
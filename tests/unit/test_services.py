@@ -14,3 +14,67 @@ def test_garbage_uses_safe_shape(monkeypatch):
     monkeypatch.setattr(llm_client, "get_keywords_text", lambda _: "totally not json")
     out = services.get_keywords_safe("x")
     assert all(k in out for k in ("informational","transactional","branded"))
+
+class _FakeResp:
+    def raise_for_status(self):
+        pass
+    def json(self):
+        return {"organic": [{"title": "t", "link": "https://a.com", "snippet": "s"}]}
+
+def test_serp_snapshot_is_cached(monkeypatch):
+    calls = []
+    def fake_post(*args, **kwargs):
+        calls.append(kwargs["json"]["q"])
+        return _FakeResp()
+    monkeypatch.setenv("SERP_PROVIDER", "serper")
+    monkeypatch.setenv("SERP_API_KEY", "k")
+    monkeypatch.setattr(services._SERP_SESSION, "post", fake_post)
+    services.clear_serp_cache()
+
+    first = services.fetch_serp_snapshot("Best Chairs")
+    second = services.fetch_serp_snapshot(" best  CHAIRS ")
+    assert first == second and len(calls) == 1
+
+    services.fetch_serp_snapshot("best chairs", use_cache=False)
+    assert len(calls) == 2
+    services.clear_serp_cache()
+
+def test_blank_keyword_skips_serp_provider(monkeypatch):
+    def fail_post(*args, **kwargs):
+        raise AssertionError("provider should not be called")
+    monkeypatch.setenv("SERP_PROVIDER", "serper")
+    monkeypatch.setenv("SERP_API_KEY", "k")
+    monkeypatch.setattr(services._SERP_SESSION, "post", fail_post)
+    rows = services.fetch_serp_snapshot("   ")
+    assert len(rows) == 5
+
+def test_serp_network_error_falls_back_to_mock(monkeypatch):
+    def down(*args, **kwargs):
+        raise services.requests.ConnectionError("offline")
+    monkeypatch.setenv("SERP_PROVIDER", "serper")
+    monkeypatch.setenv("SERP_API_KEY", "k")
+    monkeypatch.setattr(services._SERP_SESSION, "post", down)
+    services.clear_serp_cache()
+    rows = services.fetch_serp_snapshot("standing desk")
+    assert rows[0]["url"] == "https://reddit.com/r/example"
+
+def test_serp_session_retries_transient_errors():
+    adapter = services._SERP_SESSION.get_adapter("https://google.serper.dev/search")
+    assert 503 in adapter.max_retries.status_forcelist
+    assert "POST" in adapter.max_retries.allowed_methods
+    # A hung or unreachable provider costs one timeout before the mock fallback
+    assert adapter.max_retries.connect == 0 and adapter.max_retries.read == 0
+
+def test_writer_notes_prompt_embeds_compact_json(monkeypatch):
+    monkeypatch.setattr(services, "generate_text", lambda prompt, json_mode=False: "{}")
+    _, _, prompt, _ = services.generate_writer_notes(
+        keyword="café chairs",
+        brief_dict={"title": "Café chairs", "outline": {"H2": ["Intro"]}},
+        serp_summary={"weak_any": 2},
+    )
+    assert '{"title":"Café chairs","outline":{"H2":["Intro"]}}' in prompt
+    assert '{"weak_any":2}' in prompt
+
+def test_prune_empty_drops_blank_fields_only():
+    brief = {"title": " T ", "meta": "", "faq": [], "outline": {"H2": ["a", ""], "H3": []}, "n": 0, "ok": False}
+    assert services._prune_empty(brief) == {"title": "T", "outline": {"H2": ["a"]}, "n": 0, "ok": False}
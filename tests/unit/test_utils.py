@@ -153,5 +153,24 @@ class TestUtilsIntegration:
             assert result.replace("-", "").replace(".", "").isalnum() or result.startswith("report-")
 
 
+class TestJsonHelpers:
+    """Test the JSON helpers shared by the eval log readers and writers."""
+
+    def test_dumps_is_compact_and_keeps_unicode(self):
+        from utils import json_dumps
+        assert json_dumps({"kw": "café", "n": [1, 2]}) == '{"kw":"café","n":[1,2]}'
+
+    def test_round_trip(self):
+        from utils import json_dumps, json_loads
+        row = {"id": "x", "extra": {"is_json": True, "score": 72.5, "notes": None}}
+        assert json_loads(json_dumps(row)) == row
+
+    def test_dumps_accepts_what_stdlib_json_accepts(self):
+        import numpy as np
+        from utils import json_dumps, json_loads
+        row = {"score": np.float64(72.5), "volume": np.int64(1000), "by_rank": {1: "crm"}}
+        assert json_loads(json_dumps(row)) == {"score": 72.5, "volume": 1000, "by_rank": {"1": "crm"}}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
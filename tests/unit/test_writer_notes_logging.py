@@ -22,3 +22,31 @@ def test_writer_notes_logging(monkeypatch):
     assert row["variant"] == "B"
     assert row["extra"]["writer_notes_style_label"] == "Detailed"
     assert row["extra"]["writer_notes_variant"] == "B"
+
+
+def test_row_ids_sort_in_creation_order():
+    import uuid
+    import eval_logger as el
+    ids = [el._time_ordered_id(ns) for ns in (1_000_000_000, 2_000_000_000, 3_000_000_000)]
+    assert ids == sorted(ids)
+    assert all(uuid.UUID(i).version == 7 for i in ids)
+
+
+def test_utc_iso_format():
+    import eval_logger as el
+    assert el._utc_iso(1_700_000_000_123_456_789) == "2023-11-14T22:13:20.123456Z"
+
+
+def test_log_eval_recreates_removed_log_dir(monkeypatch, tmp_path):
+    import shutil
+    import eval_logger as el
+    log_dir = os.path.join(str(tmp_path), "data")
+    monkeypatch.setattr(el, "LOG_DIR", log_dir)
+    monkeypatch.setattr(el, "LOG_PATH", os.path.join(log_dir, "evals.jsonl"))
+
+    el.log_eval(variant="A", keyword="k1", prompt="p", output="o", latency_ms=1.0)
+    shutil.rmtree(log_dir)
+    el.log_eval(variant="A", keyword="k2", prompt="p", output="o", latency_ms=1.0)
+
+    rows = [json.loads(l) for l in open(el.LOG_PATH, encoding="utf-8")]
+    assert [r["keyword"] for r in rows] == ["k2"]
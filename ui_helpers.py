@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 import json
-from typing import Iterable, Optional
+from typing import Optional
 import streamlit as st
 import streamlit.components.v1 as components
 
@@ -1,5 +1,26 @@
 # ai_keyword_tool/utils.py
-import re, datetime as dt
+import json, re, datetime as dt
+
+try:
+    import orjson  # optional: 2-5x faster JSON parsing
+except ImportError:
+    orjson = None
+
+# Accepts str or bytes; raises a ValueError subclass on bad input either way
+json_loads = orjson.loads if orjson is not None else json.loads
+
+def json_dumps(obj) -> str:
+    """
+    Compact, non-ASCII-escaped JSON text; uses orjson when available.
+    Anything the stdlib encoder accepts is accepted either way: orjson gets
+    NumPy scalars and non-str keys enabled, and falls back to json on TypeError.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
 
 def slugify(value: str) -> str:
     value = (value or "").strip().lower()